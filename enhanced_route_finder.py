@@ -4,6 +4,7 @@ import folium
 from typing import List, Tuple, Dict, Optional
 from datetime import datetime, timedelta
 import heapq
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import math
 from scipy.spatial.distance import cdist
@@ -21,12 +22,24 @@ class RouteOption:
     safety_grade: str
     route_type: str  # 'direct', 'safer', 'safest', 'balanced'
     waypoints: List[Tuple[float, float]]
+    # Columnar views of the route so consumers can use vectorized math /
+    # bulk plotting instead of iterating RoutePoint objects
+    route_xy: np.ndarray = None    # (N, 2) array of (lat, lng)
+    route_scores: np.ndarray = None  # (N,) array of safety scores
+    # Full summary computed once at construction; consumers reuse it instead
+    # of walking the route again
+    summary: Dict = None
 
 class EnhancedRouteFinder(SafeRouteFinder):
     def __init__(self, incident_data_path: str):
         """Initialize the enhanced route finder"""
         super().__init__(incident_data_path)
         self.route_options = []
+        # Route options don't depend on safety_weight, so cache them per
+        # endpoint pair and reuse across repeated calls with different weights
+        self._options_cache = {}
+        # Scratch cache so strategies sharing a waypoint set build it once
+        self._waypoint_cache = {}
         
     def find_optimal_safe_route(self, 
                                start_lat: float, 
@@ -49,27 +62,36 @@ class EnhancedRouteFinder(SafeRouteFinder):
         """
         print(f"Finding optimal safe route from ({start_lat:.4f}, {start_lng:.4f}) to ({end_lat:.4f}, {end_lng:.4f})")
         
-        # Generate multiple route options
-        self.route_options = self._generate_route_options(
-            start_lat, start_lng, end_lat, end_lng, max_distance_factor
-        )
-        
-        if not self.route_options:
+        # Generate multiple route options (cached per endpoint pair since the
+        # options themselves don't depend on the safety weight)
+        cache_key = (round(start_lat, 5), round(start_lng, 5),
+                     round(end_lat, 5), round(end_lng, 5),
+                     round(max_distance_factor, 2))
+        if cache_key not in self._options_cache:
+            self._options_cache[cache_key] = self._generate_route_options(
+                start_lat, start_lng, end_lat, end_lng, max_distance_factor
+            )
+        route_options = self._options_cache[cache_key]
+        # Kept only as a last-result convenience; concurrent requests each
+        # work from their own local list
+        self.route_options = route_options
+
+        if not route_options:
             raise Exception("No valid routes found")
-        
+
         # Select the best route based on safety weight
-        best_route = self._select_best_route(safety_weight)
-        
-        # Get detailed analysis
-        summary = self.get_route_summary(best_route.route)
-        recommendations = self.get_safety_recommendations(best_route.route)
-        
+        best_route = self._select_best_route(route_options, safety_weight)
+
+        # Reuse the summary computed when the option was built
+        summary = best_route.summary
+        recommendations = self.get_safety_recommendations(best_route.route, summary=summary)
+
         return {
             'best_route': best_route,
-            'all_options': self.route_options,
+            'all_options': route_options,
             'summary': summary,
             'recommendations': recommendations,
-            'route_comparison': self._compare_routes()
+            'route_comparison': self._compare_routes(route_options)
         }
     
     def _generate_route_options(self, 
@@ -80,67 +102,74 @@ class EnhancedRouteFinder(SafeRouteFinder):
                                max_distance_factor: float) -> List[RouteOption]:
         """Generate multiple route options with different safety strategies"""
         options = []
-        
+        # Waypoint-cache keys are fully qualified by endpoint coordinates, so
+        # entries from concurrent requests never collide; cap the size instead
+        # of clearing per call, which would drop another request's entries
+        # while its strategies are mid-flight
+        if len(self._waypoint_cache) > 10000:
+            self._waypoint_cache.clear()
+
         # Calculate direct distance
         direct_distance = self.calculate_distance(start_lat, start_lng, end_lat, end_lng)
         max_distance = direct_distance * max_distance_factor
         
-        # Create safety grid if not already created
+        # Create safety grid if not already created (double-checked so only
+        # the first concurrent request builds it)
         if self.safety_grid is None:
-            bounds = (
-                min(start_lat, end_lat) - 0.02,
-                min(start_lng, end_lng) - 0.02,
-                max(start_lat, end_lat) + 0.02,
-                max(start_lng, end_lng) + 0.02
-            )
-            self.create_safety_grid(bounds)
-        
-        # Option 1: Direct route (fastest)
-        direct_route = self._create_direct_route(start_lat, start_lng, end_lat, end_lng)
-        if direct_route:
-            options.append(direct_route)
-        
-        # Option 2: Safety-optimized route
-        safe_route = self._create_safety_optimized_route(start_lat, start_lng, end_lat, end_lng, max_distance)
-        if safe_route:
-            options.append(safe_route)
-        
-        # Option 3: Balanced route
-        balanced_route = self._create_balanced_route(start_lat, start_lng, end_lat, end_lng, max_distance)
-        if balanced_route:
-            options.append(balanced_route)
-        
-        # Option 4: Perimeter route (avoids center areas)
-        perimeter_route = self._create_perimeter_route(start_lat, start_lng, end_lat, end_lng, max_distance)
-        if perimeter_route:
-            options.append(perimeter_route)
-        
-        # Option 5: Multi-path route (combines multiple safe paths)
-        multipath_route = self._create_multipath_route(start_lat, start_lng, end_lat, end_lng, max_distance)
-        if multipath_route:
-            options.append(multipath_route)
-        
+            with self._grid_lock:
+                if self.safety_grid is None:
+                    bounds = (
+                        min(start_lat, end_lat) - 0.02,
+                        min(start_lng, end_lng) - 0.02,
+                        max(start_lat, end_lat) + 0.02,
+                        max(start_lng, end_lng) + 0.02
+                    )
+                    self.create_safety_grid(bounds)
+        
+        # The five strategies are independent and only read the shared
+        # grid/tree state, so run them concurrently; the NumPy-heavy work
+        # releases the GIL. Worst case a waypoint set is computed twice
+        # before landing in _waypoint_cache, which is harmless.
+        strategies = [
+            (self._create_direct_route, (start_lat, start_lng, end_lat, end_lng)),
+            (self._create_safety_optimized_route, (start_lat, start_lng, end_lat, end_lng, max_distance)),
+            (self._create_balanced_route, (start_lat, start_lng, end_lat, end_lng, max_distance)),
+            (self._create_perimeter_route, (start_lat, start_lng, end_lat, end_lng, max_distance)),
+            (self._create_multipath_route, (start_lat, start_lng, end_lat, end_lng, max_distance)),
+        ]
+        with ThreadPoolExecutor(max_workers=len(strategies)) as executor:
+            futures = [executor.submit(fn, *args) for fn, args in strategies]
+            options = [future.result() for future in futures if future.result()]
+
         return options
     
-    def _create_direct_route(self, start_lat: float, start_lng: float, 
+    def _build_route_option(self, route: List[RoutePoint], route_type: str,
+                            waypoints: List[Tuple[float, float]]) -> RouteOption:
+        """Assemble a RouteOption (including its columnar arrays) from a route"""
+        summary = self.get_route_summary(route)
+        return RouteOption(
+            route=route,
+            total_distance=summary['total_distance_meters'],
+            avg_safety_score=summary['avg_safety_score'],
+            total_incidents=summary['total_incidents_along_route'],
+            safety_grade=summary['safety_grade'],
+            route_type=route_type,
+            waypoints=waypoints,
+            route_xy=np.array([(point.lat, point.lng) for point in route]),
+            route_scores=np.array([point.safety_score for point in route]),
+            summary=summary
+        )
+
+    def _create_direct_route(self, start_lat: float, start_lng: float,
                            end_lat: float, end_lng: float) -> Optional[RouteOption]:
         """Create a direct route (fastest path)"""
         try:
             # Simple direct route with minimal waypoints
             waypoints = [(start_lat, start_lng), (end_lat, end_lng)]
             route = self._find_optimal_path(waypoints, 0.1)  # Low safety weight for speed
-            
+
             if route:
-                summary = self.get_route_summary(route)
-                return RouteOption(
-                    route=route,
-                    total_distance=summary['total_distance_meters'],
-                    avg_safety_score=summary['avg_safety_score'],
-                    total_incidents=summary['total_incidents_along_route'],
-                    safety_grade=summary['safety_grade'],
-                    route_type='direct',
-                    waypoints=waypoints
-                )
+                return self._build_route_option(route, 'direct', waypoints)
         except Exception as e:
             print(f"Error creating direct route: {e}")
         return None
@@ -152,18 +181,9 @@ class EnhancedRouteFinder(SafeRouteFinder):
             # Generate waypoints that avoid high-incident areas
             waypoints = self._generate_safety_waypoints(start_lat, start_lng, end_lat, end_lng, max_distance, safety_focus=True)
             route = self._find_optimal_path(waypoints, 0.9)  # High safety weight
-            
+
             if route:
-                summary = self.get_route_summary(route)
-                return RouteOption(
-                    route=route,
-                    total_distance=summary['total_distance_meters'],
-                    avg_safety_score=summary['avg_safety_score'],
-                    total_incidents=summary['total_incidents_along_route'],
-                    safety_grade=summary['safety_grade'],
-                    route_type='safest',
-                    waypoints=waypoints
-                )
+                return self._build_route_option(route, 'safest', waypoints)
         except Exception as e:
             print(f"Error creating safety route: {e}")
         return None
@@ -174,18 +194,9 @@ class EnhancedRouteFinder(SafeRouteFinder):
         try:
             waypoints = self._generate_safety_waypoints(start_lat, start_lng, end_lat, end_lng, max_distance, safety_focus=False)
             route = self._find_optimal_path(waypoints, 0.5)  # Balanced weight
-            
+
             if route:
-                summary = self.get_route_summary(route)
-                return RouteOption(
-                    route=route,
-                    total_distance=summary['total_distance_meters'],
-                    avg_safety_score=summary['avg_safety_score'],
-                    total_incidents=summary['total_incidents_along_route'],
-                    safety_grade=summary['safety_grade'],
-                    route_type='balanced',
-                    waypoints=waypoints
-                )
+                return self._build_route_option(route, 'balanced', waypoints)
         except Exception as e:
             print(f"Error creating balanced route: {e}")
         return None
@@ -196,18 +207,9 @@ class EnhancedRouteFinder(SafeRouteFinder):
         try:
             waypoints = self._generate_perimeter_waypoints(start_lat, start_lng, end_lat, end_lng, max_distance)
             route = self._find_optimal_path(waypoints, 0.7)  # Medium-high safety weight
-            
+
             if route:
-                summary = self.get_route_summary(route)
-                return RouteOption(
-                    route=route,
-                    total_distance=summary['total_distance_meters'],
-                    avg_safety_score=summary['avg_safety_score'],
-                    total_incidents=summary['total_incidents_along_route'],
-                    safety_grade=summary['safety_grade'],
-                    route_type='perimeter',
-                    waypoints=waypoints
-                )
+                return self._build_route_option(route, 'perimeter', waypoints)
         except Exception as e:
             print(f"Error creating perimeter route: {e}")
         return None
@@ -218,18 +220,9 @@ class EnhancedRouteFinder(SafeRouteFinder):
         try:
             waypoints = self._generate_multipath_waypoints(start_lat, start_lng, end_lat, end_lng, max_distance)
             route = self._find_optimal_path(waypoints, 0.6)  # Medium safety weight
-            
+
             if route:
-                summary = self.get_route_summary(route)
-                return RouteOption(
-                    route=route,
-                    total_distance=summary['total_distance_meters'],
-                    avg_safety_score=summary['avg_safety_score'],
-                    total_incidents=summary['total_incidents_along_route'],
-                    safety_grade=summary['safety_grade'],
-                    route_type='multipath',
-                    waypoints=waypoints
-                )
+                return self._build_route_option(route, 'multipath', waypoints)
         except Exception as e:
             print(f"Error creating multipath route: {e}")
         return None
@@ -238,59 +231,60 @@ class EnhancedRouteFinder(SafeRouteFinder):
                                  end_lat: float, end_lng: float, max_distance: float,
                                  safety_focus: bool = True) -> List[Tuple[float, float]]:
         """Generate waypoints optimized for safety"""
-        waypoints = [(start_lat, start_lng)]
-        
-        # Calculate bearing and distance
-        bearing = self._calculate_bearing(start_lat, start_lng, end_lat, end_lng)
+        cache_key = ('safety', start_lat, start_lng, end_lat, end_lng, safety_focus)
+        if cache_key in self._waypoint_cache:
+            return self._waypoint_cache[cache_key]
+
         direct_distance = self.calculate_distance(start_lat, start_lng, end_lat, end_lng)
-        
+
         # Number of waypoints based on distance and safety focus
         if safety_focus:
             num_waypoints = max(5, int(direct_distance / 200))  # More waypoints for safety
         else:
             num_waypoints = max(3, int(direct_distance / 300))
-        
-        for i in range(1, num_waypoints):
-            progress = i / num_waypoints
-            
-            # Base position along direct route
-            base_lat = start_lat + (end_lat - start_lat) * progress
-            base_lng = start_lng + (end_lng - start_lng) * progress
-            
-            # Find safer nearby location
-            best_lat, best_lng = self._find_safest_nearby_location(base_lat, base_lng, safety_focus)
-            
-            waypoints.append((best_lat, best_lng))
-        
+
+        # All intermediate base points interpolated in one shot
+        progress = np.arange(1, num_waypoints) / num_waypoints
+        base_lats = start_lat + (end_lat - start_lat) * progress
+        base_lngs = start_lng + (end_lng - start_lng) * progress
+
+        # Nudge every base point toward its safest neighbor in one batch
+        best_lats, best_lngs = self._find_safest_nearby_locations_batch(base_lats, base_lngs, safety_focus)
+
+        waypoints = [(start_lat, start_lng)]
+        waypoints.extend(zip(best_lats.tolist(), best_lngs.tolist()))
         waypoints.append((end_lat, end_lng))
+
+        self._waypoint_cache[cache_key] = waypoints
         return waypoints
     
     def _generate_perimeter_waypoints(self, start_lat: float, start_lng: float,
                                     end_lat: float, end_lng: float, max_distance: float) -> List[Tuple[float, float]]:
         """Generate waypoints that follow the perimeter"""
-        waypoints = [(start_lat, start_lng)]
-        
+        cache_key = ('perimeter', start_lat, start_lng, end_lat, end_lng)
+        if cache_key in self._waypoint_cache:
+            return self._waypoint_cache[cache_key]
+
         # Calculate center point
         center_lat = (start_lat + end_lat) / 2
         center_lng = (start_lng + end_lng) / 2
-        
+
         # Calculate radius for perimeter
         radius = 0.005  # ~500 meters
-        
-        # Generate perimeter waypoints
+
+        # Generate all perimeter points with vectorized trig, then resolve
+        # their safest neighbors in one batch
         num_perimeter_points = 4
-        for i in range(1, num_perimeter_points + 1):
-            angle = (i / (num_perimeter_points + 1)) * 2 * math.pi
-            
-            # Calculate perimeter point
-            perim_lat = center_lat + radius * math.cos(angle)
-            perim_lng = center_lng + radius * math.sin(angle)
-            
-            # Find safe location near perimeter
-            safe_lat, safe_lng = self._find_safest_nearby_location(perim_lat, perim_lng, True)
-            waypoints.append((safe_lat, safe_lng))
-        
+        angles = (np.arange(1, num_perimeter_points + 1) / (num_perimeter_points + 1)) * 2 * np.pi
+        perim_lats = center_lat + radius * np.cos(angles)
+        perim_lngs = center_lng + radius * np.sin(angles)
+
+        safe_lats, safe_lngs = self._find_safest_nearby_locations_batch(perim_lats, perim_lngs, True)
+
+        waypoints = [(start_lat, start_lng)]
+        waypoints.extend(zip(safe_lats.tolist(), safe_lngs.tolist()))
         waypoints.append((end_lat, end_lng))
+        self._waypoint_cache[cache_key] = waypoints
         return waypoints
     
     def _generate_multipath_waypoints(self, start_lat: float, start_lng: float,
@@ -316,9 +310,6 @@ class EnhancedRouteFinder(SafeRouteFinder):
     
     def _find_safest_nearby_location(self, lat: float, lng: float, safety_focus: bool = True) -> Tuple[float, float]:
         """Find the safest location within a radius of the given point"""
-        best_lat, best_lng = lat, lng
-        best_safety = self.get_safety_score(lat, lng)
-        
         # Search radius based on safety focus
         if safety_focus:
             search_radius = 0.002  # ~200 meters
@@ -326,64 +317,82 @@ class EnhancedRouteFinder(SafeRouteFinder):
         else:
             search_radius = 0.001  # ~100 meters
             num_attempts = 8
-        
-        for attempt in range(num_attempts):
-            angle = (attempt / num_attempts) * 2 * math.pi
-            test_lat = lat + search_radius * math.cos(angle)
-            test_lng = lng + search_radius * math.sin(angle)
-            
-            test_safety = self.get_safety_score(test_lat, test_lng)
-            
-            if test_safety > best_safety:
-                best_lat, best_lng = test_lat, test_lng
-                best_safety = test_safety
-        
-        return best_lat, best_lng
+
+        # Evaluate the center point plus all candidates around it in one batch
+        angles = np.arange(num_attempts) * (2 * np.pi / num_attempts)
+        test_lats = np.append(lat, lat + search_radius * np.cos(angles))
+        test_lngs = np.append(lng, lng + search_radius * np.sin(angles))
+
+        scores = self.get_safety_scores_batch(test_lats, test_lngs)
+
+        # Center point wins ties so we only move when a candidate is strictly safer
+        best = int(np.argmax(scores))
+        return float(test_lats[best]), float(test_lngs[best])
+
+    def _find_safest_nearby_locations_batch(self, lats: np.ndarray, lngs: np.ndarray,
+                                            safety_focus: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """Batched version of _find_safest_nearby_location for arrays of points"""
+        if safety_focus:
+            search_radius = 0.002  # ~200 meters
+            num_attempts = 12
+        else:
+            search_radius = 0.001  # ~100 meters
+            num_attempts = 8
+
+        lats = np.asarray(lats, dtype=float)
+        lngs = np.asarray(lngs, dtype=float)
+
+        # Candidate matrix: column 0 is each center point, the rest its ring
+        angles = np.arange(num_attempts) * (2 * np.pi / num_attempts)
+        cand_lats = np.column_stack([lats, lats[:, None] + search_radius * np.cos(angles)])
+        cand_lngs = np.column_stack([lngs, lngs[:, None] + search_radius * np.sin(angles)])
+
+        scores = self.get_safety_scores_batch(cand_lats.ravel(), cand_lngs.ravel())
+        best = np.argmax(scores.reshape(cand_lats.shape), axis=1)
+
+        rows = np.arange(len(lats))
+        return cand_lats[rows, best], cand_lngs[rows, best]
     
     def _combine_best_path_segments(self, paths: List[List[Tuple[float, float]]], 
                                   start_lat: float, start_lng: float,
                                   end_lat: float, end_lng: float) -> List[Tuple[float, float]]:
         """Combine the best segments from multiple paths"""
-        combined = [(start_lat, start_lng)]
-        
-        # For simplicity, alternate between paths
+        # For simplicity, alternate between paths. Pad the paths into one
+        # (P, Kmax, 2) array so the alternating pick is a single fancy-index
+        # instead of a Python loop over points.
         max_points = max(len(path) for path in paths)
-        
-        for i in range(1, max_points - 1):
-            path_idx = i % len(paths)
-            if i < len(paths[path_idx]):
-                combined.append(paths[path_idx][i])
-        
-        combined.append((end_lat, end_lng))
-        return combined
+        arr = np.full((len(paths), max_points, 2), np.nan)
+        for p, path in enumerate(paths):
+            arr[p, :len(path)] = path
+
+        idx = np.arange(1, max_points - 1)
+        picked = arr[idx % len(paths), idx]
+        picked = picked[~np.isnan(picked[:, 0])]
+
+        return ([(start_lat, start_lng)]
+                + [tuple(point) for point in picked]
+                + [(end_lat, end_lng)])
     
-    def _select_best_route(self, safety_weight: float) -> RouteOption:
+    def _select_best_route(self, route_options: List[RouteOption],
+                           safety_weight: float) -> RouteOption:
         """Select the best route based on safety weight preference"""
-        if not self.route_options:
+        if not route_options:
             raise Exception("No route options available")
-        
-        best_score = -1
-        best_route = None
-        
-        for option in self.route_options:
-            # Calculate combined score (0-1, higher is better)
-            distance_score = 1 - (option.total_distance / max(opt.total_distance for opt in self.route_options))
-            safety_score = option.avg_safety_score / 100
-            
-            # Combined score based on user preference
-            combined_score = (1 - safety_weight) * distance_score + safety_weight * safety_score
-            
-            if combined_score > best_score:
-                best_score = combined_score
-                best_route = option
-        
-        return best_route
-    
-    def _compare_routes(self) -> List[Dict]:
+
+        # Score all options at once (0-1, higher is better)
+        distances = np.array([opt.total_distance for opt in route_options])
+        safety = np.array([opt.avg_safety_score for opt in route_options])
+
+        distance_score = 1 - distances / distances.max()
+        combined_score = (1 - safety_weight) * distance_score + safety_weight * (safety / 100)
+
+        return route_options[int(np.argmax(combined_score))]
+
+    def _compare_routes(self, route_options: List[RouteOption]) -> List[Dict]:
         """Compare all route options"""
         comparison = []
-        
-        for option in self.route_options:
+
+        for option in route_options:
             comparison.append({
                 'route_type': option.route_type,
                 'total_distance': float(option.total_distance),
@@ -402,16 +411,9 @@ class EnhancedRouteFinder(SafeRouteFinder):
         if not route_options:
             return None
         
-        # Calculate center
-        all_lats = []
-        all_lngs = []
-        for option in route_options:
-            for point in option.route:
-                all_lats.append(point.lat)
-                all_lngs.append(point.lng)
-        
-        center_lat = sum(all_lats) / len(all_lats)
-        center_lng = sum(all_lngs) / len(all_lngs)
+        # Calculate center over all route points in one vectorized pass
+        coords = np.concatenate([option.route_xy for option in route_options])
+        center_lat, center_lng = coords.mean(axis=0)
         
         # Create map
         m = folium.Map(location=[center_lat, center_lng], zoom_start=13)
@@ -423,11 +425,9 @@ class EnhancedRouteFinder(SafeRouteFinder):
         for i, option in enumerate(route_options):
             color = colors[i % len(colors)]
             
-            # Add route line
-            route_coords = [(point.lat, point.lng) for point in option.route]
-            
+            # Add route line straight from the cached coordinate array
             folium.PolyLine(
-                locations=route_coords,
+                locations=option.route_xy.tolist(),
                 color=color,
                 weight=4,
                 opacity=0.7,
@@ -460,10 +460,9 @@ class EnhancedRouteFinder(SafeRouteFinder):
                     ).add_to(m)
         
         # Add incident heatmap
-        incident_locations = self.incident_data[['Latitude', 'Longitude']].values.tolist()
         from folium.plugins import HeatMap
         HeatMap(
-            incident_locations,
+            self._heatmap_points,
             radius=15,
             blur=10,
             max_zoom=13
@@ -1,5 +1,15 @@
+import hashlib
+import os
+import pickle
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # Optional; stdlib json is the fallback
+    orjson = None
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 import time
@@ -25,10 +35,28 @@ class GoogleMapsRouter:
         Args:
             api_key: Google Maps API key. If None, will try to use environment variable
         """
-        self.api_key = api_key or self._get_api_key()
+        # Resolved lazily on first request so construction never blocks or
+        # raises when the router ends up unused
+        self._api_key = api_key
         self.base_url = "https://maps.googleapis.com/maps/api/directions/json"
         self.safety_finder = None
+
+        # Pooled session so repeated API calls reuse TCP/TLS connections
+        # instead of paying a fresh handshake per request
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+        # Directions responses keyed by query parameters; repeat queries skip
+        # the network round-trip entirely
+        self._route_cache = {}
         
+    @property
+    def api_key(self) -> str:
+        """Google Maps API key, resolved from the environment on first use"""
+        if self._api_key is None:
+            self._api_key = self._get_api_key()
+        return self._api_key
+
     def _get_api_key(self) -> str:
         """Get API key from environment variable"""
         import os
@@ -69,24 +97,59 @@ class GoogleMapsRouter:
             'mode': mode,
             'key': self.api_key
         }
-        
+
         if avoid:
             params['avoid'] = '|'.join(avoid)
-        
+
+        # Round coordinates to ~1m so nearly identical queries share a cache entry
+        cache_key = (round(start_lat, 5), round(start_lng, 5),
+                     round(end_lat, 5), round(end_lng, 5),
+                     mode, tuple(avoid) if avoid else None)
+        if cache_key in self._route_cache:
+            return self._route_cache[cache_key]
+
+        # Fall back to the on-disk cache so repeat queries survive restarts
+        disk_path = self._route_cache_path(cache_key)
+        if os.path.exists(disk_path):
+            try:
+                with open(disk_path, 'rb') as f:
+                    data = pickle.load(f)
+                self._route_cache[cache_key] = data
+                return data
+            except (OSError, pickle.UnpicklingError):
+                pass  # Corrupt/unreadable cache entry; refetch
+
         try:
-            response = requests.get(self.base_url, params=params)
+            response = self.session.get(self.base_url, params=params)
             response.raise_for_status()
-            
-            data = response.json()
+
+            # Directions payloads run to hundreds of KB; orjson parses them
+            # several times faster than stdlib json when available
+            if orjson is not None:
+                data = orjson.loads(response.content)
+            else:
+                data = response.json()
             
             if data['status'] != 'OK':
                 raise Exception(f"Google Maps API error: {data['status']}")
-            
+
+            self._route_cache[cache_key] = data
+            try:
+                os.makedirs(os.path.dirname(disk_path), exist_ok=True)
+                with open(disk_path, 'wb') as f:
+                    pickle.dump(data, f)
+            except OSError:
+                pass  # Cache is an optimization only
             return data
-            
+
         except requests.RequestException as e:
             raise Exception(f"Failed to get route from Google Maps: {str(e)}")
-    
+
+    def _route_cache_path(self, cache_key: Tuple) -> str:
+        """On-disk cache location for a directions query"""
+        digest = hashlib.md5(repr(cache_key).encode()).hexdigest()[:16]
+        return os.path.join('.cache', f'gmaps_route_{digest}.pkl')
+
     def parse_google_route(self, google_data: Dict) -> List[GoogleRouteStep]:
         """Parse Google Maps route data into route steps"""
         if not google_data.get('routes'):
@@ -130,50 +193,45 @@ class GoogleMapsRouter:
         if not self.safety_finder:
             raise Exception("Safety finder not set. Call set_safety_finder() first.")
         
+        if not google_steps:
+            return []
+
+        # Batch the safety lookups for all step endpoints at once instead of
+        # two scalar grid/tree queries per step
+        starts = np.array([step.start_location for step in google_steps])
+        ends = np.array([step.end_location for step in google_steps])
+
+        start_scores = self.safety_finder.get_safety_scores_batch(starts[:, 0], starts[:, 1])
+        end_scores = self.safety_finder.get_safety_scores_batch(ends[:, 0], ends[:, 1])
+        start_counts = self.safety_finder.get_incident_counts_batch(starts[:, 0], starts[:, 1])
+        end_counts = self.safety_finder.get_incident_counts_batch(ends[:, 0], ends[:, 1])
+
+        # All step distances and the running totals in one vectorized pass
+        step_distances = self.safety_finder.calculate_distance(
+            starts[:, 0], starts[:, 1], ends[:, 0], ends[:, 1]
+        )
+        cumulative = np.cumsum(step_distances)
+
         route_points = []
-        total_distance = 0
-        
         for i, step in enumerate(google_steps):
-            start_lat, start_lng = step.start_location
-            end_lat, end_lng = step.end_location
-            
-            # Get safety information for the step
-            safety_score = self.safety_finder.get_safety_score(start_lat, start_lng)
-            incident_count = self.safety_finder.get_incident_count(start_lat, start_lng)
-            
-            # Calculate distance for this step
-            step_distance = self.safety_finder.calculate_distance(
-                start_lat, start_lng, end_lat, end_lng
-            )
-            total_distance += step_distance
-            
-            # Create route point
-            route_point = RoutePoint(
-                lat=start_lat,
-                lng=start_lng,
-                safety_score=safety_score,
-                incident_count=incident_count,
-                distance_from_start=total_distance - step_distance,
-                total_distance=total_distance
-            )
-            
-            route_points.append(route_point)
-            
-            # Add end point of the step
-            end_safety_score = self.safety_finder.get_safety_score(end_lat, end_lng)
-            end_incident_count = self.safety_finder.get_incident_count(end_lat, end_lng)
-            
-            end_route_point = RoutePoint(
-                lat=end_lat,
-                lng=end_lng,
-                safety_score=end_safety_score,
-                incident_count=end_incident_count,
-                distance_from_start=total_distance,
-                total_distance=total_distance
-            )
-            
-            route_points.append(end_route_point)
-        
+            route_points.append(RoutePoint(
+                lat=step.start_location[0],
+                lng=step.start_location[1],
+                safety_score=float(start_scores[i]),
+                incident_count=int(start_counts[i]),
+                distance_from_start=float(cumulative[i] - step_distances[i]),
+                total_distance=float(cumulative[i])
+            ))
+
+            route_points.append(RoutePoint(
+                lat=step.end_location[0],
+                lng=step.end_location[1],
+                safety_score=float(end_scores[i]),
+                incident_count=int(end_counts[i]),
+                distance_from_start=float(cumulative[i]),
+                total_distance=float(cumulative[i])
+            ))
+
         return route_points
     
     def get_safe_route(self, 
@@ -1,14 +1,20 @@
+import logging
+import os
 import osmnx as ox
 import networkx as nx
 import pandas as pd
 import numpy as np
 from typing import List, Tuple, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import folium
+from scipy.spatial import cKDTree
 from scipy.spatial.distance import cdist
 import warnings
 warnings.filterwarnings('ignore')
 
+logger = logging.getLogger(__name__)
+
 @dataclass
 class RoadRoute:
     """Represents a road-aware route with safety analysis"""
@@ -31,15 +37,50 @@ class RoadAwareRouter:
             city: City name for OpenStreetMap data
         """
         self.city = city
-        self.incident_data = pd.read_csv(incident_data_path)
         self.graph = None
         self.safety_grid = None
+        # Valid incident coordinates as one contiguous float32 array; all
+        # hot paths read this instead of going through a DataFrame
+        self._incident_xy = self._load_incident_coords(incident_data_path)
+        # Spatial index over valid incident coordinates so radius queries
+        # only touch nearby incidents instead of scanning the whole frame
+        self._incident_tree = cKDTree(self._incident_xy) if len(self._incident_xy) else None
+        # Radius-count cache keyed by grid cell so nearby midpoints along a
+        # route share one KD-tree query instead of missing on raw floats
+        self._incident_count_cache = {}
+        # Nearest-node results keyed by rounded coordinates; repeat endpoints
+        # skip the spatial search entirely
+        self._nearest_node_cache = {}
         self._load_road_network()
         self._create_safety_grid()
+        self._precompute_edge_safety_costs()
         
+    def _load_incident_coords(self, data_path: str) -> np.ndarray:
+        """Validated incident coordinates, cached as a memory-mapped array
+
+        On first run the CSV is parsed once (coordinate columns only) and
+        the validated float32 array is saved as .npy; later runs map that
+        file read-only, so startup skips both the parse and the copy and
+        concurrent processes share the same pages.
+        """
+        cache_path = os.path.splitext(data_path)[0] + '_road_coords.npy'
+        if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(data_path):
+            return np.load(cache_path, mmap_mode='r')
+
+        df = pd.read_csv(data_path, usecols=['Latitude', 'Longitude'],
+                         dtype={'Latitude': 'float32', 'Longitude': 'float32'},
+                         low_memory=False)
+        coords = df.dropna().to_numpy()
+        coords = np.ascontiguousarray(coords[(coords[:, 0] != 0) & (coords[:, 1] != 0)])
+        try:
+            np.save(cache_path, coords)
+        except OSError:
+            pass  # Cache is an optimization only
+        return coords
+
     def _load_road_network(self):
         """Load road network from OpenStreetMap"""
-        print(f"Loading road network for {self.city}...")
+        logger.info("Loading road network for %s...", self.city)
         
         try:
             # Download and create the graph
@@ -48,28 +89,34 @@ class RoadAwareRouter:
             # Project to local coordinate system for accurate distance calculations
             self.graph = ox.project_graph(self.graph)
             
-            print(f"✅ Road network loaded: {len(self.graph.nodes)} nodes, {len(self.graph.edges)} edges")
-            
+            logger.info("Road network loaded: %d nodes, %d edges", len(self.graph.nodes), len(self.graph.edges))
+
+            # Node coordinates as one array so path geometry is assembled
+            # with a fancy-index instead of per-node attribute lookups
+            self._node_index = {node: i for i, node in enumerate(self.graph.nodes)}
+            self._node_ids = np.array(list(self.graph.nodes))
+            self._node_xy = np.array(
+                [[data['y'], data['x']] for _, data in self.graph.nodes(data=True)]
+            )
+            # KD-tree over node coordinates; nearest-node lookups become
+            # O(log N) queries against an index built once
+            self._node_tree = cKDTree(self._node_xy)
+
         except Exception as e:
-            print(f"❌ Error loading road network: {e}")
-            print("Falling back to basic routing...")
+            logger.warning("Error loading road network: %s; falling back to basic routing", e)
             self.graph = None
     
     def _create_safety_grid(self):
         """Create safety grid from incident data"""
-        print("Creating safety grid from incident data...")
-        
-        # Filter out invalid coordinates
-        valid_data = self.incident_data[
-            (self.incident_data['Latitude'].notna()) & 
-            (self.incident_data['Longitude'].notna()) &
-            (self.incident_data['Latitude'] != 0) & 
-            (self.incident_data['Longitude'] != 0)
-        ].copy()
+        logger.info("Creating safety grid from incident data...")
         
+        # Coordinates were validated once at init
+        inc_lat = self._incident_xy[:, 0]
+        inc_lng = self._incident_xy[:, 1]
+
         # Create grid
-        lat_min, lat_max = valid_data['Latitude'].min(), valid_data['Latitude'].max()
-        lng_min, lng_max = valid_data['Longitude'].min(), valid_data['Longitude'].max()
+        lat_min, lat_max = inc_lat.min(), inc_lat.max()
+        lng_min, lng_max = inc_lng.min(), inc_lng.max()
         
         # Create safety grid
         grid_size = 100  # meters
@@ -79,39 +126,144 @@ class RoadAwareRouter:
         lat_bins = np.arange(lat_min, lat_max + lat_step, lat_step)
         lng_bins = np.arange(lng_min, lng_max + lng_step, lng_step)
         
-        # Count incidents in each grid cell
-        self.safety_grid = np.zeros((len(lat_bins) - 1, len(lng_bins) - 1))
-        
-        for _, incident in valid_data.iterrows():
-            lat_idx = int((incident['Latitude'] - lat_min) / lat_step)
-            lng_idx = int((incident['Longitude'] - lng_min) / lng_step)
-            
-            if 0 <= lat_idx < len(lat_bins) - 1 and 0 <= lng_idx < len(lng_bins) - 1:
-                self.safety_grid[lat_idx, lng_idx] += 1
-        
+        # Count incidents in each grid cell with one vectorized bincount
+        # instead of a Python loop over every incident row
+        n_lat, n_lng = len(lat_bins) - 1, len(lng_bins) - 1
+        lat_idx = ((inc_lat - lat_min) / lat_step).astype(int)
+        lng_idx = ((inc_lng - lng_min) / lng_step).astype(int)
+
+        in_bounds = (lat_idx >= 0) & (lat_idx < n_lat) & (lng_idx >= 0) & (lng_idx < n_lng)
+        flat = lat_idx[in_bounds] * n_lng + lng_idx[in_bounds]
+        # int32 counts keep the grid small and the score gathers cache-friendly
+        self.safety_grid = np.bincount(flat, minlength=n_lat * n_lng).reshape(n_lat, n_lng).astype(np.int32)
+
+        # Reciprocal steps so index math multiplies instead of divides
+        self._inv_lat_step = 1.0 / lat_step
+        self._inv_lng_step = 1.0 / lng_step
+
+        # Summed-area table over the count grid; any rectangular window of
+        # cells can then be counted with four lookups. Zero-padded on the
+        # low edges so inclusion-exclusion needs no boundary cases.
+        self._sat = np.zeros((n_lat + 1, n_lng + 1), dtype=np.int64)
+        self._sat[1:, 1:] = self.safety_grid.cumsum(axis=0).cumsum(axis=1)
+        
+        # Count-to-score lookup table; a single gather replaces the
+        # arithmetic and clamping per queried cell (counts saturate at 255)
+        self._safety_lut = np.maximum(0, 100 - np.arange(256) * 10).astype(np.float32)
+
         self.lat_bins = lat_bins
         self.lng_bins = lng_bins
         self.lat_min, self.lat_max = lat_min, lat_max
         self.lng_min, self.lng_max = lng_min, lng_max
         
-        print(f"✅ Safety grid created: {self.safety_grid.shape[0]}x{self.safety_grid.shape[1]} cells")
+        logger.info("Safety grid created: %dx%d cells", self.safety_grid.shape[0], self.safety_grid.shape[1])
     
+    def _path_coords(self, path: List[int]) -> List[Tuple[float, float]]:
+        """(lat, lng) coordinates for a node path via one fancy-index"""
+        return [tuple(point) for point in
+                self._node_xy[[self._node_index[node] for node in path]]]
+
+    def _precompute_edge_safety_costs(self):
+        """Attach static safety costs to every edge once
+
+        Pathfinding can then use the C-level string-weight fast path instead
+        of calling a Python cost function per edge relaxation.
+        """
+        if self.graph is None or self.safety_grid is None:
+            return
+
+        edges = list(self.graph.edges(keys=True, data=True))
+        mid_lat = np.array([(self.graph.nodes[u]['y'] + self.graph.nodes[v]['y']) / 2
+                            for u, v, _, _ in edges])
+        mid_lng = np.array([(self.graph.nodes[u]['x'] + self.graph.nodes[v]['x']) / 2
+                            for u, v, _, _ in edges])
+        lengths = np.array([data.get('length', 0) for _, _, _, data in edges])
+
+        scores = self._safety_score_batch(mid_lat, mid_lng)
+        safety_costs = lengths * (1 + (100 - scores) / 100)
+        balanced_costs = lengths * (1 + (100 - scores) / 200)
+
+        nx.set_edge_attributes(
+            self.graph,
+            {(u, v, k): cost for (u, v, k, _), cost in zip(edges, safety_costs)},
+            'safety_cost'
+        )
+        nx.set_edge_attributes(
+            self.graph,
+            {(u, v, k): cost for (u, v, k, _), cost in zip(edges, balanced_costs)},
+            'balanced_cost'
+        )
+
     def get_safety_score(self, lat: float, lng: float) -> float:
         """Get safety score for a location"""
+        return float(self._safety_score_batch(np.array([lat]), np.array([lng]))[0])
+
+    def _safety_score_batch(self, lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+        """Safety scores for many locations in one vectorized pass"""
         if self.safety_grid is None:
-            return 50.0
-        
-        lat_idx = int((lat - self.lat_min) / (self.lat_max - self.lat_min) * (len(self.lat_bins) - 1))
-        lng_idx = int((lng - self.lng_min) / (self.lng_max - self.lng_min) * (len(self.lng_bins) - 1))
-        
-        if 0 <= lat_idx < self.safety_grid.shape[0] and 0 <= lng_idx < self.safety_grid.shape[1]:
-            incident_count = self.safety_grid[lat_idx, lng_idx]
-            # Convert incident count to safety score (0-100, higher is safer)
-            safety_score = max(0, 100 - (incident_count * 10))
-            return safety_score
-        
-        return 50.0
-    
+            return np.full(len(lats), 50.0)
+
+        lat_idx = ((lats - self.lat_min) * self._inv_lat_step).astype(int)
+        lng_idx = ((lngs - self.lng_min) * self._inv_lng_step).astype(int)
+
+        in_bounds = (
+            (lat_idx >= 0) & (lat_idx < self.safety_grid.shape[0]) &
+            (lng_idx >= 0) & (lng_idx < self.safety_grid.shape[1])
+        )
+        counts = self.safety_grid[lat_idx.clip(0, self.safety_grid.shape[0] - 1),
+                                  lng_idx.clip(0, self.safety_grid.shape[1] - 1)]
+        scores = self._safety_lut[np.minimum(counts.astype(int), 255)]
+        return np.where(in_bounds, scores, 50.0)
+
+    def _count_incidents_box(self, lats: np.ndarray, lngs: np.ndarray,
+                             radius_meters: float) -> np.ndarray:
+        """Incidents within a radius-sized grid window around each point
+
+        Answered in O(1) per point from the summed-area table instead of a
+        KD-tree query; the window is the square of cells covering the radius.
+        """
+        h, w = self.safety_grid.shape
+        i = ((lats - self.lat_min) * self._inv_lat_step).astype(int)
+        j = ((lngs - self.lng_min) * self._inv_lng_step).astype(int)
+
+        radius_deg = radius_meters / 111000
+        ki = max(1, int(np.ceil(radius_deg * self._inv_lat_step)))
+        kj = max(1, int(np.ceil(radius_deg * self._inv_lng_step)))
+
+        i0 = np.clip(i - ki, 0, h)
+        i1 = np.clip(i + ki + 1, 0, h)
+        j0 = np.clip(j - kj, 0, w)
+        j1 = np.clip(j + kj + 1, 0, w)
+
+        return (self._sat[i1, j1] - self._sat[i0, j1]
+                - self._sat[i1, j0] + self._sat[i0, j0])
+
+    def _route_metrics(self, route_coords: List[Tuple[float, float]]) -> Tuple[float, float, int]:
+        """Compute (total_distance, avg_safety, total_incidents) for a route
+
+        All three metrics are computed with vectorized/batched operations
+        instead of one Python call per route point.
+        """
+        pts = np.asarray(route_coords, dtype=float)
+
+        total_distance = float(np.sum(self._calculate_distance(
+            pts[:-1, 0], pts[:-1, 1], pts[1:, 0], pts[1:, 1]
+        ))) if len(pts) > 1 else 0.0
+
+        avg_safety = float(np.mean(self._safety_score_batch(pts[:, 0], pts[:, 1])))
+
+        if self.safety_grid is not None:
+            total_incidents = int(np.sum(self._count_incidents_box(pts[:, 0], pts[:, 1], 100)))
+        elif self._incident_tree is not None:
+            radius_deg = 100 / 111000
+            total_incidents = int(np.sum(self._incident_tree.query_ball_point(
+                pts, r=radius_deg, return_length=True
+            )))
+        else:
+            total_incidents = 0
+
+        return total_distance, avg_safety, total_incidents
+
     def get_safety_grade(self, safety_score: float) -> str:
         """Convert safety score to grade"""
         if safety_score >= 80:
@@ -127,12 +279,24 @@ class RoadAwareRouter:
     
     def find_nearest_node(self, lat: float, lng: float) -> int:
         """Find the nearest road network node to given coordinates"""
+        return self._find_nearest_nodes([(lat, lng)])[0]
+
+    def _find_nearest_nodes(self, points: List[Tuple[float, float]]) -> List[Optional[int]]:
+        """Nearest road node for each point, memoized on rounded coordinates
+
+        Uncached points are resolved in one batched osmnx lookup rather than
+        one spatial search per point.
+        """
         if self.graph is None:
-            return None
-        
-        # Get the nearest node to the coordinates
-        nearest_node = ox.nearest_nodes(self.graph, lng, lat)
-        return nearest_node
+            return [None] * len(points)
+
+        keys = [(round(lat, 5), round(lng, 5)) for lat, lng in points]
+        misses = [key for key in dict.fromkeys(keys) if key not in self._nearest_node_cache]
+        if misses:
+            _, nearest = self._node_tree.query(np.array(misses))
+            self._nearest_node_cache.update(zip(misses, self._node_ids[nearest]))
+
+        return [self._nearest_node_cache[key] for key in keys]
     
     def find_road_route(self, start_lat: float, start_lng: float, 
                        end_lat: float, end_lng: float,
@@ -150,17 +314,19 @@ class RoadAwareRouter:
         Returns:
             Dictionary with route information
         """
-        print(f"Finding road-aware route from ({start_lat:.4f}, {start_lng:.4f}) to ({end_lat:.4f}, {end_lng:.4f})")
+        logger.debug("Finding road-aware route from (%.4f, %.4f) to (%.4f, %.4f)",
+                     start_lat, start_lng, end_lat, end_lng)
         
         if self.graph is None:
             return self._fallback_route(start_lat, start_lng, end_lat, end_lng, safety_weight)
         
-        # Find nearest nodes
-        start_node = self.find_nearest_node(start_lat, start_lng)
-        end_node = self.find_nearest_node(end_lat, end_lng)
+        # Find nearest nodes for both endpoints in one lookup
+        start_node, end_node = self._find_nearest_nodes(
+            [(start_lat, start_lng), (end_lat, end_lng)]
+        )
         
         if start_node is None or end_node is None:
-            print("Could not find nearest road nodes, using fallback routing")
+            logger.debug("Could not find nearest road nodes, using fallback routing")
             return self._fallback_route(start_lat, start_lng, end_lat, end_lng, safety_weight)
         
         # Generate multiple route options
@@ -187,33 +353,25 @@ class RoadAwareRouter:
                                    end_lat: float, end_lng: float,
                                    safety_weight: float, max_distance_factor: float) -> List[RoadRoute]:
         """Generate multiple road-aware route options"""
-        options = []
-        
         # Calculate direct distance
         direct_distance = self._calculate_distance(start_lat, start_lng, end_lat, end_lng)
         max_distance = direct_distance * max_distance_factor
-        
-        # Option 1: Shortest path (fastest)
-        shortest_route = self._create_shortest_path_route(start_node, end_node, start_lat, start_lng, end_lat, end_lng)
-        if shortest_route:
-            options.append(shortest_route)
-        
-        # Option 2: Safety-optimized path
-        safe_route = self._create_safety_optimized_route(start_node, end_node, start_lat, start_lng, end_lat, end_lng, max_distance)
-        if safe_route:
-            options.append(safe_route)
-        
-        # Option 3: Balanced path
-        balanced_route = self._create_balanced_route(start_node, end_node, start_lat, start_lng, end_lat, end_lng, max_distance)
-        if balanced_route:
-            options.append(balanced_route)
-        
-        # Option 4: Scenic path (avoids main roads)
-        scenic_route = self._create_scenic_route(start_node, end_node, start_lat, start_lng, end_lat, end_lng, max_distance)
-        if scenic_route:
-            options.append(scenic_route)
-        
-        return options
+
+        # The four strategies are independent reads of the shared graph and
+        # grid; run them concurrently so the numpy/scipy metric work overlaps
+        strategies = [
+            (self._create_shortest_path_route,
+             (start_node, end_node, start_lat, start_lng, end_lat, end_lng)),
+            (self._create_safety_optimized_route,
+             (start_node, end_node, start_lat, start_lng, end_lat, end_lng, max_distance)),
+            (self._create_balanced_route,
+             (start_node, end_node, start_lat, start_lng, end_lat, end_lng, max_distance)),
+            (self._create_scenic_route,
+             (start_node, end_node, start_lat, start_lng, end_lat, end_lng, max_distance)),
+        ]
+        with ThreadPoolExecutor(max_workers=len(strategies)) as executor:
+            futures = [executor.submit(fn, *args) for fn, args in strategies]
+            return [future.result() for future in futures if future.result()]
     
     def _create_shortest_path_route(self, start_node: int, end_node: int,
                                   start_lat: float, start_lng: float,
@@ -224,27 +382,11 @@ class RoadAwareRouter:
             path = nx.shortest_path(self.graph, start_node, end_node, weight='length')
             
             # Get route coordinates
-            route_coords = []
-            for node in path:
-                node_data = self.graph.nodes[node]
-                route_coords.append((node_data['y'], node_data['x']))  # lat, lng
-            
-            # Calculate route metrics
-            total_distance = sum(
-                self._calculate_distance(route_coords[i][0], route_coords[i][1],
-                                       route_coords[i+1][0], route_coords[i+1][1])
-                for i in range(len(route_coords) - 1)
-            )
-            
-            # Calculate safety metrics
-            safety_scores = [self.get_safety_score(lat, lng) for lat, lng in route_coords]
-            avg_safety = np.mean(safety_scores)
-            
-            # Count incidents along route
-            total_incidents = sum(
-                self._count_nearby_incidents(lat, lng, radius_meters=100)
-                for lat, lng in route_coords
-            )
+            route_coords = self._path_coords(path)
+
+
+            # Calculate all route metrics in one vectorized pass
+            total_distance, avg_safety, total_incidents = self._route_metrics(route_coords)
             
             return RoadRoute(
                 route_points=route_coords,
@@ -258,7 +400,7 @@ class RoadAwareRouter:
             )
             
         except Exception as e:
-            print(f"Error creating shortest path route: {e}")
+            logger.warning("Error creating shortest path route: %s", e)
             return None
     
     def _create_safety_optimized_route(self, start_node: int, end_node: int,
@@ -267,43 +409,16 @@ class RoadAwareRouter:
                                      max_distance: float) -> Optional[RoadRoute]:
         """Create safety-optimized route"""
         try:
-            # Use A* with safety-weighted cost
-            def safety_cost(u, v, d):
-                # Get coordinates of the edge
-                u_coords = (self.graph.nodes[u]['y'], self.graph.nodes[u]['x'])
-                v_coords = (self.graph.nodes[v]['y'], self.graph.nodes[v]['x'])
-                
-                # Calculate safety score for this segment
-                mid_lat = (u_coords[0] + v_coords[0]) / 2
-                mid_lng = (u_coords[1] + v_coords[1]) / 2
-                safety_score = self.get_safety_score(mid_lat, mid_lng)
-                
-                # Weight the cost based on safety (lower safety = higher cost)
-                safety_factor = 1 + (100 - safety_score) / 100
-                return d['length'] * safety_factor
-            
-            path = nx.astar_path(self.graph, start_node, end_node, weight=safety_cost)
+            # Safety-weighted costs are precomputed on the edges, so the
+            # search runs on networkx's string-weight fast path
+            path = nx.shortest_path(self.graph, start_node, end_node, weight='safety_cost')
             
             # Get route coordinates and calculate metrics
-            route_coords = []
-            for node in path:
-                node_data = self.graph.nodes[node]
-                route_coords.append((node_data['y'], node_data['x']))
-            
-            total_distance = sum(
-                self._calculate_distance(route_coords[i][0], route_coords[i][1],
-                                       route_coords[i+1][0], route_coords[i+1][1])
-                for i in range(len(route_coords) - 1)
-            )
-            
-            safety_scores = [self.get_safety_score(lat, lng) for lat, lng in route_coords]
-            avg_safety = np.mean(safety_scores)
-            
-            total_incidents = sum(
-                self._count_nearby_incidents(lat, lng, radius_meters=100)
-                for lat, lng in route_coords
-            )
-            
+            route_coords = self._path_coords(path)
+
+
+            total_distance, avg_safety, total_incidents = self._route_metrics(route_coords)
+
             return RoadRoute(
                 route_points=route_coords,
                 total_distance=total_distance,
@@ -316,7 +431,7 @@ class RoadAwareRouter:
             )
             
         except Exception as e:
-            print(f"Error creating safety route: {e}")
+            logger.warning("Error creating safety route: %s", e)
             return None
     
     def _create_balanced_route(self, start_node: int, end_node: int,
@@ -325,38 +440,14 @@ class RoadAwareRouter:
                              max_distance: float) -> Optional[RoadRoute]:
         """Create balanced route between safety and distance"""
         try:
-            # Use weighted cost function
-            def balanced_cost(u, v, d):
-                u_coords = (self.graph.nodes[u]['y'], self.graph.nodes[u]['x'])
-                v_coords = (self.graph.nodes[v]['y'], self.graph.nodes[v]['x'])
-                
-                mid_lat = (u_coords[0] + v_coords[0]) / 2
-                mid_lng = (u_coords[1] + v_coords[1]) / 2
-                safety_score = self.get_safety_score(mid_lat, mid_lng)
-                
-                # Balanced weighting
-                safety_factor = 1 + (100 - safety_score) / 200  # Less aggressive than safety route
-                return d['length'] * safety_factor
-            
-            path = nx.astar_path(self.graph, start_node, end_node, weight=balanced_cost)
+            # Less aggressive safety weighting, also precomputed on the edges
+            path = nx.shortest_path(self.graph, start_node, end_node, weight='balanced_cost')
             
             # Calculate metrics
-            route_coords = [(self.graph.nodes[node]['y'], self.graph.nodes[node]['x']) for node in path]
-            
-            total_distance = sum(
-                self._calculate_distance(route_coords[i][0], route_coords[i][1],
-                                       route_coords[i+1][0], route_coords[i+1][1])
-                for i in range(len(route_coords) - 1)
-            )
-            
-            safety_scores = [self.get_safety_score(lat, lng) for lat, lng in route_coords]
-            avg_safety = np.mean(safety_scores)
-            
-            total_incidents = sum(
-                self._count_nearby_incidents(lat, lng, radius_meters=100)
-                for lat, lng in route_coords
-            )
-            
+            route_coords = self._path_coords(path)
+
+            total_distance, avg_safety, total_incidents = self._route_metrics(route_coords)
+
             return RoadRoute(
                 route_points=route_coords,
                 total_distance=total_distance,
@@ -369,7 +460,7 @@ class RoadAwareRouter:
             )
             
         except Exception as e:
-            print(f"Error creating balanced route: {e}")
+            logger.warning("Error creating balanced route: %s", e)
             return None
     
     def _create_scenic_route(self, start_node: int, end_node: int,
@@ -392,22 +483,10 @@ class RoadAwareRouter:
             path = nx.astar_path(self.graph, start_node, end_node, weight=scenic_cost)
             
             # Calculate metrics
-            route_coords = [(self.graph.nodes[node]['y'], self.graph.nodes[node]['x']) for node in path]
-            
-            total_distance = sum(
-                self._calculate_distance(route_coords[i][0], route_coords[i][1],
-                                       route_coords[i+1][0], route_coords[i+1][1])
-                for i in range(len(route_coords) - 1)
-            )
-            
-            safety_scores = [self.get_safety_score(lat, lng) for lat, lng in route_coords]
-            avg_safety = np.mean(safety_scores)
-            
-            total_incidents = sum(
-                self._count_nearby_incidents(lat, lng, radius_meters=100)
-                for lat, lng in route_coords
-            )
-            
+            route_coords = self._path_coords(path)
+
+            total_distance, avg_safety, total_incidents = self._route_metrics(route_coords)
+
             return RoadRoute(
                 route_points=route_coords,
                 total_distance=total_distance,
@@ -420,30 +499,22 @@ class RoadAwareRouter:
             )
             
         except Exception as e:
-            print(f"Error creating scenic route: {e}")
+            logger.warning("Error creating scenic route: %s", e)
             return None
     
     def _select_best_road_route(self, route_options: List[RoadRoute], safety_weight: float) -> RoadRoute:
         """Select the best route based on safety weight preference"""
         if not route_options:
             raise Exception("No route options available")
-        
-        best_score = -1
-        best_route = None
-        
-        for option in route_options:
-            # Calculate combined score (0-1, higher is better)
-            distance_score = 1 - (option.total_distance / max(opt.total_distance for opt in route_options))
-            safety_score = option.avg_safety_score / 100
-            
-            # Combined score based on user preference
-            combined_score = (1 - safety_weight) * distance_score + safety_weight * safety_score
-            
-            if combined_score > best_score:
-                best_score = combined_score
-                best_route = option
-        
-        return best_route
+
+        # Score all options at once (0-1, higher is better)
+        distances = np.array([option.total_distance for option in route_options])
+        safety = np.array([option.avg_safety_score for option in route_options])
+
+        distance_score = 1 - distances / distances.max()
+        combined_score = (1 - safety_weight) * distance_score + safety_weight * (safety / 100)
+
+        return route_options[int(np.argmax(combined_score))]
     
     def _get_road_segments(self, path: List[int]) -> List[Dict]:
         """Get road segment information for the path"""
@@ -464,8 +535,12 @@ class RoadAwareRouter:
         
         return segments
     
-    def _calculate_distance(self, lat1: float, lng1: float, lat2: float, lng2: float) -> float:
-        """Calculate distance between two points in meters"""
+    def _calculate_distance(self, lat1, lng1, lat2, lng2):
+        """Calculate distance between two points in meters
+
+        Accepts scalars or numpy arrays; array inputs are computed in one
+        vectorized pass.
+        """
         R = 6371000  # Earth's radius in meters
         
         lat1_rad = np.radians(lat1)
@@ -481,39 +556,36 @@ class RoadAwareRouter:
     
     def _count_nearby_incidents(self, lat: float, lng: float, radius_meters: float = 100) -> int:
         """Count incidents within radius of a point"""
-        if self.incident_data.empty:
+        if self._incident_tree is None:
             return 0
-        
-        # Filter incidents within radius
-        distances = []
-        for _, incident in self.incident_data.iterrows():
-            if pd.notna(incident['Latitude']) and pd.notna(incident['Longitude']):
-                dist = self._calculate_distance(lat, lng, incident['Latitude'], incident['Longitude'])
-                distances.append(dist)
-            else:
-                distances.append(float('inf'))
-        
-        # Count incidents within radius
-        nearby_count = sum(1 for dist in distances if dist <= radius_meters)
-        return nearby_count
+
+        # Quantize the key to ~100m cells so queries from the same
+        # neighborhood hit the same cache entry
+        cell = 100 / 111000
+        cache_key = (int(lat / cell), int(lng / cell), radius_meters)
+        cached = self._incident_count_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # KD-tree radius query; degree radius is a close approximation at
+        # the ~100m scales used here
+        radius_deg = radius_meters / 111000
+        count = int(self._incident_tree.query_ball_point(
+            [lat, lng], r=radius_deg, return_length=True
+        ))
+        if len(self._incident_count_cache) >= 50000:
+            self._incident_count_cache.clear()
+        self._incident_count_cache[cache_key] = count
+        return count
     
     def _fallback_route(self, start_lat: float, start_lng: float,
                        end_lat: float, end_lng: float, safety_weight: float) -> Dict:
         """Fallback to simple straight-line routing when road network is unavailable"""
-        print("Using fallback routing (straight line)")
+        logger.debug("Using fallback routing (straight line)")
         
         # Simple straight line route
         route_coords = [(start_lat, start_lng), (end_lat, end_lng)]
-        total_distance = self._calculate_distance(start_lat, start_lng, end_lat, end_lng)
-        
-        # Calculate safety metrics
-        safety_scores = [self.get_safety_score(lat, lng) for lat, lng in route_coords]
-        avg_safety = np.mean(safety_scores)
-        
-        total_incidents = sum(
-            self._count_nearby_incidents(lat, lng, radius_meters=100)
-            for lat, lng in route_coords
-        )
+        total_distance, avg_safety, total_incidents = self._route_metrics(route_coords)
         
         fallback_route = RoadRoute(
             route_points=route_coords,
@@ -540,16 +612,11 @@ class RoadAwareRouter:
         if not route_options:
             return None
         
-        # Calculate center
-        all_lats = []
-        all_lngs = []
-        for option in route_options:
-            for lat, lng in option.route_points:
-                all_lats.append(lat)
-                all_lngs.append(lng)
-        
-        center_lat = sum(all_lats) / len(all_lats)
-        center_lng = sum(all_lngs) / len(all_lngs)
+        # Calculate center over all route points in one vectorized pass
+        all_points = np.concatenate(
+            [np.asarray(option.route_points, dtype=float) for option in route_options]
+        )
+        center_lat, center_lng = all_points.mean(axis=0)
         
         # Create map
         m = folium.Map(location=[center_lat, center_lng], zoom_start=14)
@@ -585,8 +652,8 @@ class RoadAwareRouter:
                         icon=folium.Icon(color='red', icon='info-sign')
                     ).add_to(m)
         
-        # Add incident heatmap
-        incident_locations = self.incident_data[['Latitude', 'Longitude']].values.tolist()
+        # Add incident heatmap from the validated coordinate array
+        incident_locations = self._incident_xy.tolist()
         from folium.plugins import HeatMap
         HeatMap(
             incident_locations,
@@ -4,9 +4,13 @@ import folium
 from folium.plugins import HeatMap
 from typing import List, Tuple, Dict, Optional
 from datetime import datetime, timedelta
+import hashlib
 import heapq
+import os
+import threading
 from dataclasses import dataclass
 import math
+from scipy.spatial import cKDTree
 from scipy.spatial.distance import cdist
 import warnings
 warnings.filterwarnings('ignore')
@@ -29,23 +33,47 @@ class SafeRouteFinder:
         Args:
             incident_data_path: Path to the CSV file containing police incident data
         """
+        self._data_path = incident_data_path
         self.incident_data = self._load_and_preprocess_data(incident_data_path)
+        # Cache incident coordinates as a plain array for fast distance math
+        self._incident_xy = self.incident_data[['Latitude', 'Longitude']].to_numpy(dtype=np.float32)
+        # Spatial index so radius queries only touch nearby incidents
+        self._incident_tree = cKDTree(self._incident_xy) if len(self._incident_xy) else None
         self.safety_grid = None
+        # Serializes lazy grid construction so concurrent requests never
+        # score against a grid that is still being built
+        self._grid_lock = threading.Lock()
         self.grid_resolution = 0.001  # Approximately 100 meters in SF
+        # Heatmap input pre-binned once; the dataset is static
+        self._heatmap_points = self._build_heatmap_points()
         
+    # Only these columns are ever read; skipping the rest shrinks both the
+    # parse time and the resident DataFrame
+    _INCIDENT_COLUMNS = ['Incident Date', 'Incident Time', 'Incident Category',
+                         'Latitude', 'Longitude']
+
     def _load_and_preprocess_data(self, data_path: str) -> pd.DataFrame:
         """Load and preprocess the police incident data"""
         print("Loading police incident data...")
-        
-        # Load data with low_memory=False to avoid dtype warnings
-        df = pd.read_csv(data_path, low_memory=False)
-        
+
+        # Reuse the preprocessed frame from a previous run when it is newer
+        # than the CSV; re-parsing the full CSV dominates startup otherwise
+        cache_path = os.path.splitext(data_path)[0] + '_preprocessed.pkl'
+        if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(data_path):
+            df = pd.read_pickle(cache_path)
+            print(f"Loaded {len(df)} preprocessed incidents from cache")
+            return df
+
+        # Load only the needed columns
+        df = pd.read_csv(data_path, usecols=self._INCIDENT_COLUMNS, low_memory=False)
+
         # Clean and filter the data
         df = df.dropna(subset=['Latitude', 'Longitude'])
-        
-        # Convert to numeric, coercing errors to NaN
-        df['Latitude'] = pd.to_numeric(df['Latitude'], errors='coerce')
-        df['Longitude'] = pd.to_numeric(df['Longitude'], errors='coerce')
+
+        # Convert to numeric, coercing errors to NaN; float32 is plenty for
+        # city-scale coordinates and halves the memory footprint
+        df['Latitude'] = pd.to_numeric(df['Latitude'], errors='coerce', downcast='float')
+        df['Longitude'] = pd.to_numeric(df['Longitude'], errors='coerce', downcast='float')
         
         # Remove rows with invalid coordinates
         df = df.dropna(subset=['Latitude', 'Longitude'])
@@ -74,10 +102,33 @@ class SafeRouteFinder:
         }
         
         df['Severity'] = df['Incident Category'].map(severity_mapping).fillna(1)
-        
+
         print(f"Loaded {len(df)} incidents from {df['Incident Date'].min()} to {df['Incident Date'].max()}")
+
+        try:
+            df.to_pickle(cache_path)
+        except OSError:
+            pass  # Cache is an optimization only; a read-only dir is fine
+
         return df
     
+    def _build_heatmap_points(self) -> List[List[float]]:
+        """Aggregate incidents into weighted grid-cell points for the heatmap
+
+        Shipping one weighted point per occupied cell instead of every raw
+        incident keeps the rendered HTML small and saves the browser from
+        re-binning the full dataset.
+        """
+        if len(self._incident_xy) == 0:
+            return []
+
+        cells = np.round(self._incident_xy / self.grid_resolution).astype(int)
+        uniq, counts = np.unique(cells, axis=0, return_counts=True)
+
+        # Weight each cell by its incident count, normalized to 0-1
+        weights = counts / counts.max()
+        return np.column_stack([uniq * self.grid_resolution, weights]).tolist()
+
     def create_safety_grid(self, bounds: Tuple[float, float, float, float] = None):
         """
         Create a safety grid based on incident density and severity
@@ -96,91 +147,142 @@ class SafeRouteFinder:
             )
         
         min_lat, min_lng, max_lat, max_lng = bounds
-        
+
+        # Reuse a previously built grid for the same data/bounds/resolution;
+        # building it is the expensive one-time step
+        cache_path = self._grid_cache_path(bounds)
+        if (os.path.exists(cache_path) and
+                os.path.getmtime(cache_path) >= os.path.getmtime(self._data_path)):
+            cached = np.load(cache_path)
+            self.safety_grid = cached['safety_grid'].astype(np.float32, copy=False)
+            self.lat_grid = cached['lat_grid']
+            self.lng_grid = cached['lng_grid']
+            self._lat0 = self.lat_grid[0]
+            self._lng0 = self.lng_grid[0]
+            print(f"Loaded safety grid with shape {self.safety_grid.shape} from cache")
+            return
+
         # Create grid
         lat_grid = np.arange(min_lat, max_lat, self.grid_resolution)
         lng_grid = np.arange(min_lng, max_lng, self.grid_resolution)
-        
-        # Initialize safety grid
-        self.safety_grid = np.zeros((len(lat_grid), len(lng_grid)))
+
+
+        # Bin every incident into its grid cell in one vectorized pass instead
+        # of scanning the whole DataFrame once per cell
+        inc_lat = self.incident_data['Latitude'].to_numpy()
+        inc_lng = self.incident_data['Longitude'].to_numpy()
+        lat_idx = np.floor((inc_lat - min_lat) / self.grid_resolution).astype(int)
+        lng_idx = np.floor((inc_lng - min_lng) / self.grid_resolution).astype(int)
+
+        in_bounds = (
+            (lat_idx >= 0) & (lat_idx < len(lat_grid)) &
+            (lng_idx >= 0) & (lng_idx < len(lng_grid))
+        )
+        lat_idx, lng_idx = lat_idx[in_bounds], lng_idx[in_bounds]
+
+        # Per-cell aggregates via bincount on flattened cell indices
+        n_cells = len(lat_grid) * len(lng_grid)
+        flat = lat_idx * len(lng_grid) + lng_idx
+        counts = np.bincount(flat, minlength=n_cells)
+        severity_sum = np.bincount(flat, weights=self.incident_data['Severity'].to_numpy()[in_bounds],
+                                   minlength=n_cells)
+        night_sum = np.bincount(flat, weights=self.incident_data['Is_Night'].to_numpy()[in_bounds],
+                                minlength=n_cells)
+
+        # Safety score decreases with more incidents and higher severity;
+        # night incidents are weighted more heavily
+        avg_severity = np.divide(severity_sum, counts, out=np.zeros(n_cells), where=counts > 0)
+        safety = 100 - (counts * 2) - (avg_severity * 3) - (night_sum * 5)
+        safety = np.where(counts > 0, np.maximum(0, safety), 100)  # No incidents = high safety
+
+        # float32 scores are exact enough on a 0-100 scale and halve the
+        # memory traffic of bulk grid lookups. Publish the grid attributes
+        # only once fully built, so concurrent readers never see a
+        # half-constructed (all-zero) grid
         self.lat_grid = lat_grid
         self.lng_grid = lng_grid
-        
-        # Calculate incident density and severity for each grid cell
-        for i, lat in enumerate(lat_grid):
-            for j, lng in enumerate(lng_grid):
-                # Find incidents within this grid cell
-                mask = (
-                    (self.incident_data['Latitude'] >= lat) &
-                    (self.incident_data['Latitude'] < lat + self.grid_resolution) &
-                    (self.incident_data['Longitude'] >= lng) &
-                    (self.incident_data['Longitude'] < lng + self.grid_resolution)
-                )
-                
-                cell_incidents = self.incident_data[mask]
-                
-                if len(cell_incidents) > 0:
-                    # Calculate safety score based on incident count and severity
-                    incident_count = len(cell_incidents)
-                    avg_severity = cell_incidents['Severity'].mean()
-                    night_incidents = cell_incidents['Is_Night'].sum()
-                    
-                    # Safety score decreases with more incidents and higher severity
-                    # Night incidents are weighted more heavily
-                    safety_score = 100 - (incident_count * 2) - (avg_severity * 3) - (night_incidents * 5)
-                    self.safety_grid[i, j] = max(0, safety_score)
-                else:
-                    self.safety_grid[i, j] = 100  # No incidents = high safety
-        
+        self._lat0 = lat_grid[0]
+        self._lng0 = lng_grid[0]
+        self.safety_grid = safety.reshape(len(lat_grid), len(lng_grid)).astype(np.float32)
+
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            np.savez(cache_path, safety_grid=self.safety_grid,
+                     lat_grid=lat_grid, lng_grid=lng_grid)
+        except OSError:
+            pass  # Cache is an optimization only
+
         print(f"Created safety grid with shape {self.safety_grid.shape}")
+
+    def _grid_cache_path(self, bounds: Tuple[float, float, float, float]) -> str:
+        """On-disk cache location for a grid built over the given bounds"""
+        key = f"{self._data_path}|{[round(b, 6) for b in bounds]}|{self.grid_resolution}"
+        digest = hashlib.md5(key.encode()).hexdigest()[:16]
+        return os.path.join('.cache', f'safety_grid_{digest}.npz')
     
     def get_safety_score(self, lat: float, lng: float) -> float:
         """Get safety score for a specific location"""
         if self.safety_grid is None:
             return 50  # Default safety score
-        
-        # Find the closest grid cell
-        lat_idx = np.argmin(np.abs(self.lat_grid - lat))
-        lng_idx = np.argmin(np.abs(self.lng_grid - lng))
-        
+
+        return float(self._score_idx(lat, lng))
+
+    def _score_idx(self, lat, lng):
+        """Look up safety scores by direct grid indexing (scalar or array input)"""
+        # The grid is uniform, so the nearest cell is just (coord - origin) / cell size
+        lat_idx = np.clip(np.rint((np.asarray(lat) - self._lat0) / self.grid_resolution).astype(int),
+                          0, len(self.lat_grid) - 1)
+        lng_idx = np.clip(np.rint((np.asarray(lng) - self._lng0) / self.grid_resolution).astype(int),
+                          0, len(self.lng_grid) - 1)
         return self.safety_grid[lat_idx, lng_idx]
+
+    def get_safety_scores_batch(self, lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+        """Get safety scores for many locations in one vectorized lookup"""
+        lats = np.asarray(lats, dtype=float)
+        lngs = np.asarray(lngs, dtype=float)
+
+        if self.safety_grid is None:
+            return np.full(lats.shape, 50.0)  # Default safety score
+
+        return self._score_idx(lats, lngs)
     
     def get_incident_count(self, lat: float, lng: float, radius_meters: float = 100) -> int:
         """Get number of incidents within a radius of a location"""
+        return int(self.get_incident_counts_batch([lat], [lng], radius_meters)[0])
+
+    def get_incident_counts_batch(self, lats: np.ndarray, lngs: np.ndarray,
+                                  radius_meters: float = 100) -> np.ndarray:
+        """Get incident counts around many locations in one vectorized pass"""
+        query = np.column_stack([np.asarray(lats, dtype=float), np.asarray(lngs, dtype=float)])
+
+        if self._incident_tree is None:
+            return np.zeros(len(query), dtype=int)
+
         # Convert meters to approximate degrees (rough approximation)
         radius_deg = radius_meters / 111000  # 1 degree ≈ 111km
-        
-        mask = (
-            (self.incident_data['Latitude'] >= lat - radius_deg) &
-            (self.incident_data['Latitude'] <= lat + radius_deg) &
-            (self.incident_data['Longitude'] >= lng - radius_deg) &
-            (self.incident_data['Longitude'] <= lng + radius_deg)
-        )
-        
-        nearby_incidents = self.incident_data[mask]
-        
-        # Calculate exact distance for more precision
-        distances = np.sqrt(
-            (nearby_incidents['Latitude'] - lat) ** 2 + 
-            (nearby_incidents['Longitude'] - lng) ** 2
-        ) * 111000  # Convert to meters
-        
-        return len(distances[distances <= radius_meters])
+
+        # KD-tree ball query only visits incidents near each point instead of
+        # computing a full query-by-incident distance matrix
+        return self._incident_tree.query_ball_point(query, r=radius_deg, return_length=True)
     
-    def calculate_distance(self, lat1: float, lng1: float, lat2: float, lng2: float) -> float:
-        """Calculate distance between two points in meters"""
+    def calculate_distance(self, lat1, lng1, lat2, lng2):
+        """Calculate distance between two points in meters
+
+        Accepts scalars or equally-shaped NumPy arrays, so whole batches of
+        segments can be measured in one call.
+        """
         # Haversine formula
         R = 6371000  # Earth's radius in meters
-        
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lat = math.radians(lat2 - lat1)
-        delta_lng = math.radians(lng2 - lng1)
-        
-        a = (math.sin(delta_lat / 2) ** 2 + 
-             math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lng / 2) ** 2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        
+
+        lat1_rad = np.radians(lat1)
+        lat2_rad = np.radians(lat2)
+        delta_lat = np.radians(np.subtract(lat2, lat1))
+        delta_lng = np.radians(np.subtract(lng2, lng1))
+
+        a = (np.sin(delta_lat / 2) ** 2 +
+             np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(delta_lng / 2) ** 2)
+        c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
         return R * c
     
     def find_safe_route(self, 
@@ -204,15 +306,18 @@ class SafeRouteFinder:
         """
         print(f"Finding safe route from ({start_lat:.4f}, {start_lng:.4f}) to ({end_lat:.4f}, {end_lng:.4f})")
         
-        # Create safety grid if not already created
+        # Create safety grid if not already created (double-checked so only
+        # the first concurrent request builds it)
         if self.safety_grid is None:
-            bounds = (
-                min(start_lat, end_lat) - 0.01,
-                min(start_lng, end_lng) - 0.01,
-                max(start_lat, end_lat) + 0.01,
-                max(start_lng, end_lng) + 0.01
-            )
-            self.create_safety_grid(bounds)
+            with self._grid_lock:
+                if self.safety_grid is None:
+                    bounds = (
+                        min(start_lat, end_lat) - 0.01,
+                        min(start_lng, end_lng) - 0.01,
+                        max(start_lat, end_lat) + 0.01,
+                        max(start_lng, end_lng) + 0.01
+                    )
+                    self.create_safety_grid(bounds)
         
         # Calculate direct distance
         direct_distance = self.calculate_distance(start_lat, start_lng, end_lat, end_lng)
@@ -230,14 +335,9 @@ class SafeRouteFinder:
     def _generate_waypoints(self, start_lat: float, start_lng: float, 
                            end_lat: float, end_lng: float, max_distance: float) -> List[Tuple[float, float]]:
         """Generate waypoints along the route following realistic street patterns"""
-        waypoints = []
-        
-        # Add start point
-        waypoints.append((start_lat, start_lng))
-        
         # Calculate direct distance and determine number of major waypoints
         direct_distance = self.calculate_distance(start_lat, start_lng, end_lat, end_lng)
-        
+
         # For longer routes, create more waypoints to simulate street turns
         if direct_distance > 2000:  # Routes longer than 2km
             num_waypoints = 6
@@ -245,71 +345,52 @@ class SafeRouteFinder:
             num_waypoints = 4
         else:
             num_waypoints = 3
-        
+
         # Calculate the bearing from start to end
         bearing = self._calculate_bearing(start_lat, start_lng, end_lat, end_lng)
-        
-        # Create intermediate waypoints with realistic street patterns
-        for i in range(1, num_waypoints):
-            # Calculate progress along the route
-            progress = i / num_waypoints
-            
-            # Base position along the direct route
-            base_lat = start_lat + (end_lat - start_lat) * progress
-            base_lng = start_lng + (end_lng - start_lng) * progress
-            
-            # Add realistic street routing variations
-            # Simulate following streets by creating perpendicular turns
-            
-            # Determine turn direction based on progress and bearing
-            if i % 2 == 0:
-                # Create a "right turn" - perpendicular to the main direction
-                turn_angle = bearing + 90  # Right turn
-            else:
-                # Create a "left turn" - perpendicular to the main direction
-                turn_angle = bearing - 90  # Left turn
-            
-            # Calculate turn distance (how far to go perpendicular)
-            turn_distance = 0.002  # ~200 meters perpendicular movement
-            
-            # Calculate the turn offset
-            turn_lat_offset = turn_distance * math.cos(math.radians(turn_angle))
-            turn_lng_offset = turn_distance * math.sin(math.radians(turn_angle))
-            
-            # Apply the turn
-            waypoint_lat = base_lat + turn_lat_offset
-            waypoint_lng = base_lng + turn_lng_offset
-            
-            # Add some randomness to make it more realistic
-            random_offset = 0.0003  # ~30 meters random variation
-            waypoint_lat += np.random.normal(0, random_offset)
-            waypoint_lng += np.random.normal(0, random_offset)
-            
-            # Check safety and try to find safer nearby location if needed
-            safety_score = self.get_safety_score(waypoint_lat, waypoint_lng)
-            
-            if safety_score < 40:
-                # Try to find a safer location nearby
-                for attempt in range(8):
-                    # Try different directions around the waypoint
-                    angle = attempt * 45  # 45 degrees = 360/8
-                    radius = 0.001  # ~100 meters
-                    
-                    new_lat = waypoint_lat + radius * math.cos(math.radians(angle))
-                    new_lng = waypoint_lng + radius * math.sin(math.radians(angle))
-                    
-                    new_safety = self.get_safety_score(new_lat, new_lng)
-                    if new_safety > safety_score + 10:  # Only move if significantly safer
-                        waypoint_lat, waypoint_lng = new_lat, new_lng
-                        safety_score = new_safety
-                        break
-            
-            waypoints.append((waypoint_lat, waypoint_lng))
-        
-        # Add end point
-        waypoints.append((end_lat, end_lng))
-        
-        return waypoints
+
+        # Build all intermediate waypoints in one vectorized pass: base
+        # positions along the direct line, alternating perpendicular "turns"
+        # to simulate street patterns, plus a little random variation
+        idx = np.arange(1, num_waypoints)
+        progress = idx / num_waypoints
+        base_lat = start_lat + (end_lat - start_lat) * progress
+        base_lng = start_lng + (end_lng - start_lng) * progress
+
+        # Right turn on even waypoints, left turn on odd ones
+        turn_angle = np.radians(np.where(idx % 2 == 0, bearing + 90, bearing - 90))
+        turn_distance = 0.002  # ~200 meters perpendicular movement
+        random_offset = 0.0003  # ~30 meters random variation
+
+        wp_lat = (base_lat + turn_distance * np.cos(turn_angle)
+                  + np.random.normal(0, random_offset, idx.size))
+        wp_lng = (base_lng + turn_distance * np.sin(turn_angle)
+                  + np.random.normal(0, random_offset, idx.size))
+
+        # For unsafe waypoints, probe a ring of 8 nearby candidates and move
+        # to the first one that is significantly safer
+        scores = self.get_safety_scores_batch(wp_lat, wp_lng)
+        unsafe = np.where(scores < 40)[0]
+        if len(unsafe):
+            angles = np.radians(np.arange(8) * 45)
+            radius = 0.001  # ~100 meters
+            cand_lat = wp_lat[unsafe, None] + radius * np.cos(angles)
+            cand_lng = wp_lng[unsafe, None] + radius * np.sin(angles)
+            cand_scores = self.get_safety_scores_batch(
+                cand_lat.ravel(), cand_lng.ravel()
+            ).reshape(cand_lat.shape)
+
+            better = cand_scores > scores[unsafe, None] + 10  # Only move if significantly safer
+            has_better = better.any(axis=1)
+            first_better = np.argmax(better, axis=1)
+
+            move_rows = np.where(has_better)[0]
+            wp_lat[unsafe[move_rows]] = cand_lat[move_rows, first_better[move_rows]]
+            wp_lng[unsafe[move_rows]] = cand_lng[move_rows, first_better[move_rows]]
+
+        return ([(start_lat, start_lng)]
+                + list(zip(wp_lat.tolist(), wp_lng.tolist()))
+                + [(end_lat, end_lng)])
     
     def _find_optimal_path(self, waypoints: List[Tuple[float, float]], safety_weight: float) -> List[RoutePoint]:
         """Find optimal path through waypoints using dynamic programming with realistic routing"""
@@ -321,26 +402,27 @@ class SafeRouteFinder:
             n = len(enhanced_waypoints)
             waypoints = enhanced_waypoints
         
-        # Calculate distances and safety scores between all waypoints
-        distances = np.zeros((n, n))
-        safety_scores = np.zeros((n, n))
-        
-        for i in range(n):
-            for j in range(n):
-                if i != j:
-                    lat1, lng1 = waypoints[i]
-                    lat2, lng2 = waypoints[j]
-                    distances[i, j] = self.calculate_distance(lat1, lng1, lat2, lng2)
-                    
-                    # Safety score is average of both points
-                    safety1 = self.get_safety_score(lat1, lng1)
-                    safety2 = self.get_safety_score(lat2, lng2)
-                    safety_scores[i, j] = (safety1 + safety2) / 2
-        
-        # Normalize distances and safety scores
-        max_dist = distances.max()
-        max_safety = safety_scores.max()
-        
+        # Calculate distances and safety scores between all waypoints with
+        # broadcasting instead of an O(n^2) Python loop
+        wp = np.asarray(waypoints)
+        wp_lat, wp_lng = wp[:, 0], wp[:, 1]
+
+        distances = self.calculate_distance(
+            wp_lat[:, None], wp_lng[:, None], wp_lat[None, :], wp_lng[None, :]
+        )
+        point_safety = self.get_safety_scores_batch(wp_lat, wp_lng)
+        # Safety score of a pair is the average of both points
+        safety_scores = (point_safety[:, None] + point_safety[None, :]) / 2
+        np.fill_diagonal(distances, 0)
+        np.fill_diagonal(safety_scores, 0)
+
+
+        # Normalize distances and safety scores; guard against degenerate
+        # all-zero matrices so the cost matrix stays finite and Dijkstra
+        # always returns a start-to-end path
+        max_dist = distances.max() or 1.0
+        max_safety = safety_scores.max() or 1.0
+
         distances_norm = distances / max_dist
         safety_scores_norm = safety_scores / max_safety
         
@@ -350,30 +432,26 @@ class SafeRouteFinder:
         # Find shortest path using Dijkstra's algorithm
         path = self._dijkstra(costs, 0, n-1)
         
-        # Convert to RoutePoint objects
-        route_points = []
-        total_distance = 0
-        
-        for i, point_idx in enumerate(path):
-            lat, lng = waypoints[point_idx]
-            safety_score = self.get_safety_score(lat, lng)
-            incident_count = self.get_incident_count(lat, lng)
-            
-            if i > 0:
-                prev_lat, prev_lng = waypoints[path[i-1]]
-                segment_distance = self.calculate_distance(prev_lat, prev_lng, lat, lng)
-                total_distance += segment_distance
-            
-            route_points.append(RoutePoint(
-                lat=lat,
-                lng=lng,
-                safety_score=safety_score,
-                incident_count=incident_count,
-                distance_from_start=total_distance,
-                total_distance=total_distance
-            ))
-        
-        return route_points
+        # Convert to RoutePoint objects; segment distances and safety
+        # lookups for the whole path are computed in single batched calls
+        path_pts = wp[path]
+        seg = self.calculate_distance(path_pts[:-1, 0], path_pts[:-1, 1],
+                                      path_pts[1:, 0], path_pts[1:, 1])
+        cumulative = np.concatenate([[0.0], np.cumsum(seg)])
+        scores = self.get_safety_scores_batch(path_pts[:, 0], path_pts[:, 1])
+        counts = self.get_incident_counts_batch(path_pts[:, 0], path_pts[:, 1])
+
+        return [
+            RoutePoint(
+                lat=float(path_pts[i, 0]),
+                lng=float(path_pts[i, 1]),
+                safety_score=float(scores[i]),
+                incident_count=int(counts[i]),
+                distance_from_start=float(cumulative[i]),
+                total_distance=float(cumulative[i])
+            )
+            for i in range(len(path))
+        ]
     
     def _add_intermediate_waypoints(self, waypoints: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
         """Add intermediate waypoints to create more realistic routes"""
@@ -556,9 +634,8 @@ class SafeRouteFinder:
         ).add_to(m)
         
         # Add incident data as heatmap
-        incident_locations = self.incident_data[['Latitude', 'Longitude']].values.tolist()
         HeatMap(
-            incident_locations,
+            self._heatmap_points,
             radius=15,
             blur=10,
             max_zoom=13
@@ -612,16 +689,16 @@ class SafeRouteFinder:
         
         return directions
     
-    def _calculate_bearing(self, lat1: float, lng1: float, lat2: float, lng2: float) -> float:
-        """Calculate bearing between two points"""
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lng = math.radians(lng2 - lng1)
-        
-        y = math.sin(delta_lng) * math.cos(lat2_rad)
-        x = math.cos(lat1_rad) * math.sin(lat2_rad) - math.sin(lat1_rad) * math.cos(lat2_rad) * math.cos(delta_lng)
-        
-        bearing = math.degrees(math.atan2(y, x))
+    def _calculate_bearing(self, lat1, lng1, lat2, lng2):
+        """Calculate bearing between two points (scalar or array inputs)"""
+        lat1_rad = np.radians(lat1)
+        lat2_rad = np.radians(lat2)
+        delta_lng = np.radians(np.subtract(lng2, lng1))
+
+        y = np.sin(delta_lng) * np.cos(lat2_rad)
+        x = np.cos(lat1_rad) * np.sin(lat2_rad) - np.sin(lat1_rad) * np.cos(lat2_rad) * np.cos(delta_lng)
+
+        bearing = np.degrees(np.arctan2(y, x))
         return (bearing + 360) % 360
     
     def _get_direction_text(self, bearing: float) -> str:
@@ -692,10 +769,14 @@ class SafeRouteFinder:
         else:
             return 'F'
     
-    def get_safety_recommendations(self, route: List[RoutePoint]) -> List[str]:
-        """Get safety recommendations based on the route analysis"""
+    def get_safety_recommendations(self, route: List[RoutePoint], summary: Dict = None) -> List[str]:
+        """Get safety recommendations based on the route analysis
+
+        Pass an already-computed summary to avoid re-walking the route.
+        """
         recommendations = []
-        summary = self.get_route_summary(route)
+        if summary is None:
+            summary = self.get_route_summary(route)
         
         if summary['avg_safety_score'] < 60:
             recommendations.append("⚠️ This route passes through areas with high incident rates. Consider traveling during daylight hours.")
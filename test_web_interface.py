@@ -0,0 +1,96 @@
+"""Regression tests for the web JSON layer
+
+Route payloads carry numpy scalars (inside tuples, e.g. RouteOption.waypoints);
+orjson rejects those unless they are converted or OPT_SERIALIZE_NUMPY is set,
+which once broke every /find_route response. Run with: python -m unittest
+"""
+import sys
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from enhanced_route_finder import RouteOption
+from safe_route_finder import RoutePoint
+
+# Import the app without loading the incident CSV
+with patch('enhanced_route_finder.EnhancedRouteFinder'):
+    sys.modules.pop('web_interface', None)
+    import web_interface
+
+
+def _numpy_route_result():
+    """A find_optimal_safe_route result laced with numpy types, as the real
+    finder produces"""
+    point = RoutePoint(
+        lat=np.float64(37.7694), lng=np.float64(-122.4862),
+        safety_score=np.float64(94.5), incident_count=np.int64(1),
+        distance_from_start=np.float64(0.0), total_distance=np.float64(8011.0)
+    )
+    option = RouteOption(
+        route=[point],
+        total_distance=np.float64(8011.0),
+        avg_safety_score=np.float64(94.5),
+        total_incidents=np.int64(1),
+        safety_grade='A+',
+        route_type='direct',
+        waypoints=[(np.float64(37.7694), np.float64(-122.4862)),
+                   (np.float64(37.8087), np.float64(-122.4098))],
+        summary={'safety_grade': 'A+', 'avg_safety_score': np.float64(94.5)}
+    )
+    return {
+        'best_route': option,
+        'all_options': [option],
+        'summary': option.summary,
+        'recommendations': [],
+        'route_comparison': []
+    }
+
+
+class _StubFinder:
+    def find_optimal_safe_route(self, *args, **kwargs):
+        return _numpy_route_result()
+
+
+class ConvertNumpyTypesTests(unittest.TestCase):
+    def test_recurses_into_tuples(self):
+        converted = web_interface.convert_numpy_types(
+            {'waypoints': [(np.float64(37.7), np.float64(-122.4))]}
+        )
+        self.assertEqual(converted, {'waypoints': [[37.7, -122.4]]})
+        self.assertIsInstance(converted['waypoints'][0][0], float)
+
+
+class FindRouteEndpointTests(unittest.TestCase):
+    def setUp(self):
+        self._saved_finder = web_interface.route_finder
+        web_interface.route_finder = _StubFinder()
+        self.client = web_interface.app.test_client()
+
+    def tearDown(self):
+        web_interface.route_finder = self._saved_finder
+
+    def test_find_route_serializes_numpy_payload(self):
+        response = self.client.post('/find_route', json={
+            'start_lat': 37.7694, 'start_lng': -122.4862,
+            'end_lat': 37.8087, 'end_lng': -122.4098
+        })
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertTrue(data['success'])
+        self.assertEqual(data['best_route']['waypoints'],
+                         [[37.7694, -122.4862], [37.8087, -122.4098]])
+
+    def test_batch_endpoint_serializes_numpy_payload(self):
+        response = self.client.post('/find_route/batch', json={
+            'items': [{'start_lat': 37.7694, 'start_lng': -122.4862,
+                       'end_lat': 37.8087, 'end_lng': -122.4098}]
+        })
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertTrue(data['success'])
+        self.assertEqual(data['results'][0]['best_route']['safety_grade'], 'A+')
+
+
+if __name__ == '__main__':
+    unittest.main()
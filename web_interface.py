@@ -1,19 +1,74 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, Response
 import json
 import os
+import threading
+import time
 from datetime import datetime
 import numpy as np
 from enhanced_route_finder import EnhancedRouteFinder
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # Optional; stdlib json is the fallback
+    orjson = None
+
+try:
+    from flask_compress import Compress
+except ImportError:  # Optional; responses go out uncompressed without it
+    Compress = None
+
+try:
+    from flask_limiter import Limiter
+    from flask_limiter.util import get_remote_address
+except ImportError:  # Optional; endpoints are unthrottled without it
+    Limiter = None
+
 # Load environment variables
 load_dotenv()
 
 app = Flask(__name__)
 
+# Compact output for anything Flask itself serializes (error pages, etc.);
+# endpoint payloads already go out compact via ojsonify
+app.json.compact = True
+
+# Route responses are large, repetitive JSON (coordinate lists compress very
+# well), so gzip them when the client supports it
+if Compress is not None:
+    app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html']
+    app.config['COMPRESS_LEVEL'] = 5
+    app.config['COMPRESS_MIN_SIZE'] = 500
+    Compress(app)
+
+# In-memory rate limiting; route finding is the expensive endpoint, so it
+# gets a tighter limit than the default
+if Limiter is not None:
+    limiter = Limiter(
+        get_remote_address,
+        app=app,
+        default_limits=["60 per minute"],
+        storage_uri="memory://",
+        strategy="fixed-window",
+    )
+    _route_limit = limiter.limit("10 per minute")
+else:
+    def _route_limit(f):
+        return f
+
 # Initialize the enhanced route finder
 route_finder = EnhancedRouteFinder('Police_Department_Incident_Reports__2018_to_Present_20250621.csv')
 
+# Safety-info responses keyed by rounded location; map clicks cluster around
+# the same spots, so a short TTL turns repeats into a dict lookup
+_safety_info_cache = {}
+_SAFETY_INFO_TTL = 300  # seconds
+
+# Cap concurrent route computations; each one fans out worker threads of its
+# own, so unbounded overlap degrades every in-flight request. Excess requests
+# get a fast 503 instead of queueing
+_route_slots = threading.BoundedSemaphore(8)
+
 def convert_numpy_types(obj):
     """Convert numpy types to native Python types for JSON serialization"""
     if isinstance(obj, np.integer):
@@ -24,20 +79,91 @@ def convert_numpy_types(obj):
         return obj.tolist()
     elif isinstance(obj, dict):
         return {key: convert_numpy_types(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
+    elif isinstance(obj, (list, tuple)):
         return [convert_numpy_types(item) for item in obj]
     return obj
 
+def ojsonify(payload, status: int = 200) -> Response:
+    """Build a JSON response with orjson when available
+
+    Route payloads run to hundreds of KB of route points; orjson serializes
+    them several times faster than flask.jsonify and emits compact bytes.
+    """
+    payload = convert_numpy_types(payload)
+    if orjson is not None:
+        # OPT_SERIALIZE_NUMPY is a safety net for numpy scalars that slip
+        # past convert_numpy_types; orjson rejects them by default
+        body = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        body = json.dumps(payload, separators=(',', ':'))
+    return Response(body, status=status, mimetype='application/json')
+
+def _request_json() -> dict:
+    """Parse the POST body with orjson when available"""
+    if orjson is not None:
+        return orjson.loads(request.get_data())
+    return request.get_json()
+
+def _route_option_dict(option) -> dict:
+    """Serialize one RouteOption for a JSON response"""
+    return {
+        'route_type': option.route_type,
+        'total_distance': option.total_distance,
+        'avg_safety_score': option.avg_safety_score,
+        'total_incidents': option.total_incidents,
+        'safety_grade': option.safety_grade,
+        'waypoints': option.waypoints,
+        'route_points': [(point.lat, point.lng) for point in option.route]
+    }
+
+def _route_payload(result, fields=None) -> dict:
+    """Assemble the response payload for one route-finding result
+
+    `fields` optionally restricts which route-option keys are returned;
+    clients that only need summaries can drop the bulky route_points lists.
+    """
+    best_route = _route_option_dict(result['best_route'])
+    all_options = [_route_option_dict(option) for option in result['all_options']]
+    if fields:
+        wanted = set(fields)
+        best_route = {key: value for key, value in best_route.items() if key in wanted}
+        all_options = [{key: value for key, value in option.items() if key in wanted}
+                       for option in all_options]
+    return {
+        'best_route': best_route,
+        'route_comparison': result['route_comparison'],
+        'summary': result['summary'],
+        'recommendations': result['recommendations'],
+        'all_options': all_options
+    }
+
+@app.after_request
+def _cache_generated_maps(response):
+    """Long-lived caching for saved route maps
+
+    Map filenames are timestamped, so their content never changes; letting the
+    browser cache them avoids re-downloading multi-MB folium pages on revisit.
+    Flask's static handler already supplies the ETag for conditional requests.
+    """
+    if request.path.startswith('/static/maps/'):
+        response.cache_control.public = True
+        response.cache_control.max_age = 86400
+        response.cache_control.immutable = True
+    return response
+
 @app.route('/')
 def index():
     """Main page"""
     return render_template('index.html')
 
 @app.route('/find_route', methods=['POST'])
+@_route_limit
 def find_route():
     """Find the optimal safe route using enhanced route finder"""
+    if not _route_slots.acquire(blocking=False):
+        return ojsonify({'success': False, 'error': 'Server busy, please retry shortly'}, 503)
     try:
-        data = request.get_json()
+        data = _request_json()
         
         # Extract parameters
         start_lat = float(data['start_lat'])
@@ -56,75 +182,103 @@ def find_route():
             max_distance_factor=max_distance_factor
         )
         
-        # Convert numpy types for JSON serialization
-        response_data = convert_numpy_types({
-            'success': True,
-            'best_route': {
-                'route_type': result['best_route'].route_type,
-                'total_distance': result['best_route'].total_distance,
-                'avg_safety_score': result['best_route'].avg_safety_score,
-                'total_incidents': result['best_route'].total_incidents,
-                'safety_grade': result['best_route'].safety_grade,
-                'waypoints': result['best_route'].waypoints,
-                'route_points': [(point.lat, point.lng) for point in result['best_route'].route]
-            },
-            'route_comparison': result['route_comparison'],
-            'summary': result['summary'],
-            'recommendations': result['recommendations'],
-            'all_options': [
-                {
-                    'route_type': option.route_type,
-                    'total_distance': option.total_distance,
-                    'avg_safety_score': option.avg_safety_score,
-                    'total_incidents': option.total_incidents,
-                    'safety_grade': option.safety_grade,
-                    'waypoints': option.waypoints,
-                    'route_points': [(point.lat, point.lng) for point in option.route]
-                }
-                for option in result['all_options']
-            ]
-        })
-        
-        return jsonify(response_data)
-        
+        response_data = {'success': True, **_route_payload(result, fields=data.get('fields'))}
+
+        return ojsonify(response_data)
+
     except Exception as e:
         print(f"Error finding route: {e}")
-        return jsonify({
+        return ojsonify({
+            'success': False,
+            'error': str(e)
+        }, 500)
+    finally:
+        _route_slots.release()
+
+@app.route('/find_route/batch', methods=['POST'])
+@_route_limit
+def find_route_batch():
+    """Find routes for several origin/destination pairs in one request
+
+    Amortizes the per-request HTTP and JSON overhead across the batch; the
+    finder's internal caches also get warm across items that share endpoints.
+    """
+    if not _route_slots.acquire(blocking=False):
+        return ojsonify({'success': False, 'error': 'Server busy, please retry shortly'}, 503)
+    try:
+        data = _request_json()
+        items = data.get('items', [])
+        if not items:
+            return ojsonify({'success': False, 'error': 'No items provided'}, 400)
+        if len(items) > 25:
+            return ojsonify({'success': False, 'error': 'Batch limited to 25 items'}, 400)
+
+        fields = data.get('fields')
+        results = []
+        for item in items:
+            result = route_finder.find_optimal_safe_route(
+                float(item['start_lat']), float(item['start_lng']),
+                float(item['end_lat']), float(item['end_lng']),
+                safety_weight=float(item.get('safety_weight', 0.7)),
+                max_distance_factor=float(item.get('max_distance_factor', 2.0))
+            )
+            results.append(_route_payload(result, fields=fields))
+
+        return ojsonify({'success': True, 'results': results})
+
+    except Exception as e:
+        print(f"Error finding batch routes: {e}")
+        return ojsonify({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
+    finally:
+        _route_slots.release()
 
 @app.route('/get_safety_info', methods=['POST'])
 def get_safety_info():
     """Get safety information for a specific location"""
     try:
-        data = request.get_json()
+        data = _request_json()
         lat = float(data['lat'])
         lng = float(data['lng'])
-        
+
+        # ~10m resolution; nearby clicks share an entry
+        cache_key = (round(lat, 4), round(lng, 4))
+        cached = _safety_info_cache.get(cache_key)
+        if cached is not None and time.time() - cached[1] < _SAFETY_INFO_TTL:
+            return ojsonify(cached[0])
+
         # Get safety score and nearby incidents
         safety_score = route_finder.get_safety_score(lat, lng)
-        nearby_incidents = route_finder.get_nearby_incidents(lat, lng, radius_meters=500)
-        
-        return jsonify({
+        nearby_incidents = route_finder.get_incident_count(lat, lng, radius_meters=500)
+
+        payload = {
             'success': True,
             'safety_score': float(safety_score),
-            'safety_grade': route_finder.get_safety_grade(safety_score),
-            'nearby_incidents': convert_numpy_types(nearby_incidents)
-        })
-        
+            'safety_grade': route_finder._get_safety_grade(safety_score),
+            'nearby_incidents': int(nearby_incidents)
+        }
+        if len(_safety_info_cache) > 10000:
+            _safety_info_cache.clear()
+        _safety_info_cache[cache_key] = (payload, time.time())
+        return ojsonify(payload)
+
     except Exception as e:
         print(f"Error getting safety info: {e}")
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
 
 @app.route('/visualize_routes', methods=['POST'])
+@_route_limit
 def visualize_routes():
     """Create a map visualization of all route options"""
+    if not _route_slots.acquire(blocking=False):
+        return ojsonify({'success': False, 'error': 'Server busy, please retry shortly'}, 503)
     try:
-        data = request.get_json()
+        data = _request_json()
         start_lat = float(data['start_lat'])
         start_lng = float(data['start_lng'])
         end_lat = float(data['end_lat'])
@@ -150,17 +304,24 @@ def visualize_routes():
         os.makedirs(os.path.dirname(map_path), exist_ok=True)
         map_obj.save(map_path)
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'map_url': f'/static/maps/{map_filename}'
         })
-        
+
     except Exception as e:
         print(f"Error creating visualization: {e}")
-        return jsonify({
+        return ojsonify({
             'success': False,
             'error': str(e)
-        }), 500
+        }, 500)
+    finally:
+        _route_slots.release()
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000) 
\ No newline at end of file
+    # threaded=True lets requests overlap instead of serializing behind the
+    # single dev-server worker while one request is busy in route finding.
+    # Debug mode (reloader + per-request overhead) stays opt-in via the env
+    # var rather than being hardcoded on
+    debug = os.getenv('FLASK_DEBUG', '').lower() in ('1', 'true')
+    app.run(debug=debug, host='0.0.0.0', port=5000, threaded=True) 
\ No newline at end of file